@@ -4,6 +4,7 @@ Keep imports minimal and side-effect free.
 """
 
 from .jvlogger import JVLogger
+from .server import start_log_server
 from .signing import Signer, HMACSigner, RSASigner
 
-__all__ = ["JVLogger", "Signer", "HMACSigner", "RSASigner"]
\ No newline at end of file
+__all__ = ["JVLogger", "start_log_server", "Signer", "HMACSigner", "RSASigner"]
\ No newline at end of file
@@ -1,29 +1,93 @@
 """
 Formatters: ColoredFormatter for console, JsonFormatter for file output.
 JsonFormatter accepts an optional signer implementing sign/verify API.
+JSON lines are encoded with orjson when available, stdlib json otherwise.
 """
 
+import functools
 import logging
 import json
 from datetime import datetime
 from typing import Optional
 from .signing import Signer
 from colorama import Fore, Style
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 _COLOR_LEVELS = {
-    "DEBUG": Fore.BLUE + Style.DIM,
-    "INFO": Fore.GREEN,
-    "WARNING": Fore.YELLOW,
-    "ERROR": Fore.RED,
-    "CRITICAL": Fore.RED + Style.BRIGHT,
+    logging.DEBUG: Fore.BLUE + Style.DIM,
+    logging.INFO: Fore.GREEN,
+    logging.WARNING: Fore.YELLOW,
+    logging.ERROR: Fore.RED,
+    logging.CRITICAL: Fore.RED + Style.BRIGHT,
 }
 
+# Colorized level names built once, keyed by (levelno, levelname) so a level renamed
+# with logging.addLevelName() still shows its current name
+_COLORED_LEVELNAMES = {
+    (levelno, logging.getLevelName(levelno)): f"{color}{logging.getLevelName(levelno)}{Style.RESET_ALL}"
+    for levelno, color in _COLOR_LEVELS.items()
+}
+
+LOG_FORMAT = "%(asctime)s - [%(name)s] - %(levelname)s - %(message)s"
+
+# Key order matches the dict built by JsonFormatter._build()
+_JSON_LINE = '{"timestamp":"%s","name":%s,"level":%s,"message":%s,"file":%s,"line":%d,"function":%s}'
+_JSON_LINE_BYTES = _JSON_LINE.encode("ascii")
+
+
+# (millisecond key, ISO string, ISO bytes) of the last formatted timestamp. Bursts of
+# records share a millisecond; the tuple is swapped atomically so no lock is needed.
+_ts_cache = (-1, "", b"")
+
+
+def _timestamp_entry(created: float) -> tuple:
+    global _ts_cache
+    entry = _ts_cache
+    key = int(created * 1000)
+    if key != entry[0]:
+        ts = datetime.fromtimestamp(key / 1000).isoformat(timespec="milliseconds")
+        entry = _ts_cache = (key, ts, ts.encode("ascii"))
+    return entry
+
+
+def _iso_timestamp(created: float) -> str:
+    """Local ISO-8601 timestamp with millisecond precision, cached per millisecond."""
+    return _timestamp_entry(created)[1]
+
+
+def _iso_timestamp_bytes(created: float) -> bytes:
+    return _timestamp_entry(created)[2]
+
+
+@functools.lru_cache(maxsize=1024)
+def _json_string(value: Optional[str]) -> str:
+    """JSON-escape a low-cardinality field (logger name, level, file, function) once."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=1024)
+def _json_bytes(value: Optional[str]) -> bytes:
+    """Bytes counterpart of _json_string() for JsonFormatter.format_bytes()."""
+    return json.dumps(value).encode("ascii")
+
 class ColoredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
-        color = _COLOR_LEVELS.get(record.levelname, "")
-        record_copy = logging.makeLogRecord(record.__dict__.copy())
-        record_copy.levelname = f"{color}{record.levelname}{Style.RESET_ALL}"
-        return super().format(record_copy)
+        # Colorize levelname in place and restore it, rather than copying the record
+        levelname = record.levelname
+        colored = _COLORED_LEVELNAMES.get((record.levelno, levelname))
+        if colored is None and record.levelno in _COLOR_LEVELS:
+            colored = f"{_COLOR_LEVELS[record.levelno]}{levelname}{Style.RESET_ALL}"
+        if colored:
+            record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 class JsonFormatter(logging.Formatter):
     """
@@ -34,15 +98,34 @@ class JsonFormatter(logging.Formatter):
     def __init__(self, signer: Optional[Signer] = None):
         super().__init__()
         self.signer = signer
+        self._dumps = orjson.dumps if ORJSON_AVAILABLE else None
+
+    def _encode(self, obj) -> str:
+        if self._dumps is not None:
+            try:
+                return self._dumps(obj).decode("utf-8")
+            except TypeError:
+                # orjson rejects e.g. lone surrogates; stdlib json copes with them
+                pass
+        return json.dumps(obj, ensure_ascii=False)
+
+    def _encode_bytes(self, obj) -> bytes:
+        if self._dumps is not None:
+            try:
+                return self._dumps(obj)
+            except TypeError:
+                pass
+        # ASCII-escaped so lone surrogates still encode
+        return json.dumps(obj).encode("ascii")
 
     @staticmethod
     def _canonical_bytes(obj: dict) -> bytes:
         # stable deterministic serialization
         return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
-    def format(self, record: logging.LogRecord) -> str:
+    def _build(self, record: logging.LogRecord) -> dict:
         obj = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": _iso_timestamp(record.created),
             "name": record.name,
             "level": record.levelname,
             "message": record.getMessage(),
@@ -52,6 +135,9 @@ class JsonFormatter(logging.Formatter):
         }
         if record.exc_info:
             obj["traceback"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # traceback already rendered, e.g. by a RemoteQueueHandler
+            obj["traceback"] = record.exc_text
 
         if self.signer:
             # compute signature over canonicalized payload (without 'signature' field)
@@ -59,4 +145,34 @@ class JsonFormatter(logging.Formatter):
             signature_b64 = self.signer.sign(canonical)
             obj["signature"] = signature_b64
 
-        return json.dumps(obj, ensure_ascii=False)
\ No newline at end of file
+        return obj
+
+    def format(self, record: logging.LogRecord) -> str:
+        if record.exc_info or record.exc_text or self.signer:
+            return self._encode(self._build(record))
+
+        # Fast path: only the message needs escaping per record
+        return _JSON_LINE % (
+            _iso_timestamp(record.created),
+            _json_string(record.name),
+            _json_string(record.levelname),
+            self._encode(record.getMessage()),
+            _json_string(record.filename),
+            record.lineno,
+            _json_string(record.funcName),
+        )
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Same JSON line as format(), already UTF-8 encoded for binary handlers."""
+        if record.exc_info or record.exc_text or self.signer:
+            return self._encode_bytes(self._build(record))
+
+        return _JSON_LINE_BYTES % (
+            _iso_timestamp_bytes(record.created),
+            _json_bytes(record.name),
+            _json_bytes(record.levelname),
+            self._encode_bytes(record.getMessage()),
+            _json_bytes(record.filename),
+            record.lineno,
+            _json_bytes(record.funcName),
+        )
@@ -0,0 +1,306 @@
+"""
+Handlers used by JVLogger.
+
+LocalQueueHandler hands records to a QueueListener thread which owns the
+file handlers, so the calling thread only pays for a queue put.
+RemoteQueueHandler, run by that listener thread, forwards records to a log
+server process (see server.py).
+The file handlers write through a 64 KB buffer and only flush on warnings,
+once FLUSH_INTERVAL has elapsed, or when the listener goes idle.
+"""
+
+import copy
+import gzip
+import io
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+from .formatters import LOG_FORMAT, JsonFormatter
+from .signing import Signer
+
+DEFAULT_BACKUP_COUNT = 7
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+BUFFER_SIZE = 64 * 1024
+FLUSH_INTERVAL = 0.2  # seconds
+GZIP_LEVEL = 1  # rotation is rare, keep the CPU cost of compressing low
+
+# Formatters hold no per-logger state, so every handler shares these
+# (a JsonFormatter with a signer is still built per logger).
+_TEXT_FORMATTER = logging.Formatter(LOG_FORMAT)
+_JSON_FORMATTER = JsonFormatter()
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process queue.
+
+    The stock prepare() pre-formats the record and drops exc_info so it can be
+    pickled. Records never leave the process here, so only the message is merged
+    and the traceback is kept for the formatters on the listener side.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+class RemoteQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a queue living in another process.
+
+    Every put is a round trip to the server, so JVLogger drives this handler from
+    a QueueListener thread instead of attaching it to the logger.
+
+    Records are pickled, so the message is merged and the traceback rendered into
+    exc_text (which both the text and JSON formatters pick up) before sending.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                formatter = self.formatter or logging.Formatter()
+                record.exc_text = formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that flushes its handlers once the queue has been idle for
+    FLUSH_INTERVAL, so buffered records reach the disk without a per-record flush.
+    """
+
+    flush_interval = FLUSH_INTERVAL
+
+    def __init__(self, q, *handlers, respect_handler_level: bool = False):
+        super().__init__(q, *handlers, respect_handler_level=respect_handler_level)
+        self._pending = False
+
+    def dequeue(self, block: bool):
+        if block and self._pending:
+            try:
+                return self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush_handlers()
+        return self.queue.get(block)
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        self._pending = True
+
+    def _flush_handlers(self) -> None:
+        self._pending = False
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+
+class _BufferedStreamMixin:
+    """
+    Open the log file behind an io.BufferedWriter and defer flushing.
+    Must be mixed into a logging.FileHandler subclass.
+    """
+
+    buffer_size = BUFFER_SIZE
+    flush_interval = FLUSH_INTERVAL
+    _last_flush = 0.0
+
+    def _open_buffered(self) -> io.BufferedWriter:
+        raw = open(self.baseFilename, self.mode + "b", buffering=0)
+        return io.BufferedWriter(raw, self.buffer_size)
+
+    def _open(self):
+        return io.TextIOWrapper(
+            self._open_buffered(),
+            encoding=self.encoding,
+            errors=self.errors,
+            write_through=False,
+        )
+
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def _flush_if_due(self, record: logging.LogRecord) -> None:
+        if record.levelno >= logging.WARNING or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+
+class BufferedTimedRotatingFileHandler(_BufferedStreamMixin, logging.handlers.TimedRotatingFileHandler):
+    """TimedRotatingFileHandler writing through a buffered stream."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._flush_if_due(record)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedRotatingFileHandler(_BufferedStreamMixin, logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler writing through a buffered stream.
+
+    The file size is tracked in a running counter, so the stat/seek/tell done by
+    shouldRollover() only happens once a record would cross maxBytes.
+    """
+
+    _bytes_written = 0
+
+    def _open(self):
+        stream = super()._open()
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def _render(self, record: logging.LogRecord) -> Tuple[str, int]:
+        """Return the text to write and its size in bytes on disk."""
+        msg = self.format(record) + self.terminator
+        return msg, len(msg.encode(self.encoding or "utf-8", self.errors or "strict"))
+
+    def _write(self, msg: str) -> None:
+        self.stream.write(msg)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg, size = self._render(record)
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._bytes_written + size >= self.maxBytes:
+                if super().shouldRollover(record):
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                else:
+                    # not a regular file, or the counter drifted: resync from the stream
+                    self._bytes_written = self.stream.tell()
+            self._write(msg)
+            self._bytes_written += size
+            self._flush_if_due(record)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BinaryRotatingFileHandler(BufferedRotatingFileHandler):
+    """
+    BufferedRotatingFileHandler writing bytes straight to the io.BufferedWriter.
+
+    Formatters providing format_bytes() (JsonFormatter) skip the str -> UTF-8
+    encode of the text layer, and the byte count comes for free.
+    """
+
+    def _open(self):
+        stream = self._open_buffered()
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def _render(self, record: logging.LogRecord) -> Tuple[bytes, int]:
+        format_bytes = getattr(self.formatter, "format_bytes", None)
+        if format_bytes is not None:
+            data = format_bytes(record)
+        else:
+            data = self.format(record).encode(self.encoding or "utf-8", self.errors or "strict")
+        return data, len(data) + 1
+
+    def _write(self, data: bytes) -> None:
+        # two buffered writes instead of copying the line to append the newline
+        self.stream.write(data)
+        self.stream.write(b"\n")
+
+
+def gzip_namer(name: str) -> str:
+    """Namer for rotating handlers whose backups are gzip-compressed."""
+    return name + ".gz"
+
+
+def gzip_rotator(source: str, dest: str) -> None:
+    """Rotator compressing the rolled-over file into dest (already named by gzip_namer)."""
+    if not os.path.exists(source):
+        return
+    with open(source, "rb") as src_f, gzip.open(dest, "wb", compresslevel=GZIP_LEVEL) as dest_f:
+        shutil.copyfileobj(src_f, dest_f, 1 << 20)
+    os.remove(source)
+
+
+def rollover_if_oversized(path: Path, max_bytes: Optional[int] = None) -> None:
+    """
+    Size-rotate a JSON file written outside a handler (e.g. by a merge), with the
+    same gzipped backups as the JSON handler.
+    """
+    if max_bytes is None:
+        max_bytes = DEFAULT_MAX_BYTES
+    try:
+        if os.path.getsize(path) < max_bytes:
+            return
+    except OSError:
+        return
+    handler = logging.handlers.RotatingFileHandler(
+        str(path), maxBytes=max_bytes, backupCount=DEFAULT_BACKUP_COUNT, delay=True
+    )
+    handler.namer = gzip_namer
+    handler.rotator = gzip_rotator
+    try:
+        handler.doRollover()
+    finally:
+        handler.close()
+
+
+def create_file_handlers(
+    text_path: Path,
+    json_path: Path,
+    signer: Optional[Signer] = None,
+    max_bytes: Optional[int] = None,
+) -> Tuple[logging.Handler, logging.Handler]:
+    """
+    Build the text (daily rotation) and JSON (size rotation, gzipped backups) file handlers.
+    They are meant to be driven by a QueueListener, not attached to a logger.
+    Files are only opened on the first record.
+    max_bytes overrides DEFAULT_MAX_BYTES for the JSON file; 0 disables size rotation.
+    """
+    if max_bytes is None:
+        max_bytes = DEFAULT_MAX_BYTES
+    text_handler = BufferedTimedRotatingFileHandler(
+        filename=str(text_path),
+        when="midnight",
+        backupCount=DEFAULT_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
+    )
+    text_handler.setLevel(logging.DEBUG)
+    text_handler.setFormatter(_TEXT_FORMATTER)
+
+    json_handler = BinaryRotatingFileHandler(
+        filename=str(json_path),
+        maxBytes=max_bytes,
+        backupCount=DEFAULT_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
+    )
+    json_handler.setLevel(logging.DEBUG)
+    json_handler.setFormatter(JsonFormatter(signer=signer) if signer else _JSON_FORMATTER)
+    # JSON compresses well; backups become <name>.json.1.gz, <name>.json.2.gz, ...
+    json_handler.namer = gzip_namer
+    json_handler.rotator = gzip_rotator
+
+    return text_handler, json_handler
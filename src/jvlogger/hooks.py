@@ -3,6 +3,8 @@ Global exception hooks. They are not installed on import.
 Call install_global_exception_handlers() explicitly from your application if needed.
 """
 
+import atexit
+import os
 import sys
 import logging
 import traceback
@@ -13,13 +15,59 @@ from pathlib import Path
 LAST_CRASH_FILE = Path(__file__).resolve().parent.parent / "last_crash.log"
 _GLOBAL_HOOKS_INSTALLED = False
 
+# last_crash.log is opened once when the hooks are installed, so a crash only
+# needs truncate + write instead of allocating a new fd while the process dies.
+_crash_fd = None
+_crash_lock = threading.Lock()
+
+def _open_crash_file():
+    global _crash_fd
+    if _crash_fd is not None:
+        return
+    try:
+        _crash_fd = os.open(str(LAST_CRASH_FILE), os.O_WRONLY | os.O_CREAT, 0o644)
+    except OSError:
+        # read-only install location etc.: dump_last_crash falls back to open()
+        return
+    atexit.register(_close_crash_file)
+
+def _close_crash_file():
+    global _crash_fd
+    # under the lock: an executor thread may be in dump_last_crash on this fd
+    with _crash_lock:
+        fd, _crash_fd = _crash_fd, None
+        if fd is not None:
+            atexit.unregister(_close_crash_file)
+            os.close(fd)
+
 def dump_last_crash(exc_type, exc_value, exc_tb):
     try:
-        with open(LAST_CRASH_FILE, "w", encoding="utf-8") as f:
-            traceback.print_exception(exc_type, exc_value, exc_tb, file=f)
+        data = "".join(traceback.format_exception(exc_type, exc_value, exc_tb)).encode("utf-8")
+        with _crash_lock:
+            if _crash_fd is None:
+                with open(LAST_CRASH_FILE, "wb") as f:
+                    f.write(data)
+                return
+            os.ftruncate(_crash_fd, 0)
+            os.lseek(_crash_fd, 0, os.SEEK_SET)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(_crash_fd, view):]
     except Exception:
         pass
 
+def dump_last_crash_async(loop, exc_type, exc_value, exc_tb):
+    """
+    Write last_crash.log from the loop's default executor so the event loop is not
+    blocked by file I/O. Falls back to a synchronous dump if the loop cannot schedule it.
+    """
+    try:
+        return loop.run_in_executor(None, dump_last_crash, exc_type, exc_value, exc_tb)
+    except RuntimeError:
+        # loop closed or its executor already shut down
+        dump_last_crash(exc_type, exc_value, exc_tb)
+        return None
+
 def sys_excepthook(exc_type, exc_value, exc_tb):
     logger = logging.getLogger()
     if issubclass(exc_type, KeyboardInterrupt):
@@ -43,7 +91,7 @@ def asyncio_exception_handler(loop, context):
     message = context.get("message", "Asyncio exception")
     if exception:
         logger.error(message, exc_info=exception)
-        dump_last_crash(type(exception), exception, exception.__traceback__)
+        dump_last_crash_async(loop, type(exception), exception, exception.__traceback__)
     else:
         logger.error(message)
 
@@ -55,6 +103,7 @@ def install_global_exception_handlers():
     if _GLOBAL_HOOKS_INSTALLED:
         return
 
+    _open_crash_file()
     sys.excepthook = sys_excepthook
 
     if sys.version_info >= (3, 8):
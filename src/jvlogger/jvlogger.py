@@ -3,27 +3,135 @@ Main Logger wrapper. Exposes Logger class that configures:
 - colored console handler
 - rotating text file handler (daily)
 - rotating json file handler (size-based)
+- background queue listener owning the file handlers
+- or, when LOG_SERVER_ADDR is set, forwarding to a central log server
 - optional single-instance lock (platform-specific)
 - optional signer passed into JsonFormatter
 - optional global exception hooks (installable)
 """
 
+import atexit
+import functools
 import logging
 import logging.handlers
+import multiprocessing
+import os
+import queue
 import sys
 import socket
-import psutil
 from pathlib import Path
 from typing import Optional
-from .formatters import ColoredFormatter, JsonFormatter
+from .formatters import LOG_FORMAT, ColoredFormatter
+from .handlers import (
+    DEFAULT_BACKUP_COUNT,  # noqa: F401  (kept importable from here)
+    FlushingQueueListener,
+    LocalQueueHandler,
+    RemoteQueueHandler,
+    create_file_handlers,
+    rollover_if_oversized,
+)
 from .hooks import install_global_exception_handlers
 from .mutex import create_lock
 from .exceptions import SingleInstanceError
 from .signing import Signer
 from .lifecycle import ApplicationLifecycleLogger
+from .server import LOG_SERVER_ENV, connect_to_server
+from .utils import default_app_name
 
 
-DEFAULT_BACKUP_COUNT = 7
+_GLOBAL_INIT_DONE = False
+_CONSOLE_FORMATTER = ColoredFormatter(LOG_FORMAT)
+
+# listener -> (logger, queue handler) for every listener not stopped yet. Held here
+# rather than through the JVLogger, so instances are not kept alive until exit.
+_RUNNING_LISTENERS = {}
+
+
+def _drain_listener(listener, logger: logging.Logger, queue_handler: logging.Handler) -> None:
+    """Detach the queue handler, drain pending records and close the listener's handlers."""
+    # nothing may be enqueued once the listener has stopped reading
+    logger.removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        try:
+            handler.close()
+        except Exception:
+            pass
+
+
+@atexit.register
+def _drain_running_listeners() -> None:
+    while _RUNNING_LISTENERS:
+        listener, (logger, queue_handler) = _RUNNING_LISTENERS.popitem()
+        _drain_listener(listener, logger, queue_handler)
+
+
+def _flush_before_fork() -> None:
+    # A child gets a copy of the write buffers: empty them first or both processes
+    # write them out. The handler locks are held across the fork so that nothing
+    # gets buffered in between.
+    for listener in _RUNNING_LISTENERS:
+        for handler in listener.handlers:
+            handler.acquire()
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+
+def _release_after_fork_in_parent() -> None:
+    for listener in _RUNNING_LISTENERS:
+        for handler in listener.handlers:
+            handler.release()
+
+
+def _detach_listeners_in_child() -> None:
+    # Listener threads do not survive a fork, and logging has already reset the
+    # handler locks. The child writes from the logging thread instead, flushing
+    # every record since it may leave through os._exit() (as multiprocessing does).
+    while _RUNNING_LISTENERS:
+        listener, (logger, queue_handler) = _RUNNING_LISTENERS.popitem()
+        logger.removeHandler(queue_handler)
+        for handler in listener.handlers:
+            handler.flush_interval = 0
+            logger.addHandler(handler)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_flush_before_fork,
+        after_in_parent=_release_after_fork_in_parent,
+        after_in_child=_detach_listeners_in_child,
+    )
+
+
+def _one_time_global_init(install_excepthooks: bool) -> None:
+    """Process-wide side effects, applied once whatever the number of loggers."""
+    global _GLOBAL_INIT_DONE
+    if not _GLOBAL_INIT_DONE:
+        logging.captureWarnings(True)
+        _GLOBAL_INIT_DONE = True
+
+    if install_excepthooks:
+        # has its own once-only guard; a later logger may ask for hooks the first did not
+        install_global_exception_handlers()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_log_dir() -> Path:
+    """<script_dir>/logs/<hostname>, resolved and created once per process."""
+    hostname = socket.gethostname()
+
+    # Frozen executable (PyInstaller)
+    if hasattr(sys, "_MEIPASS"):
+        base_dir = Path(sys.executable).resolve().parent
+    else:
+        base_dir = Path(sys.argv[0]).resolve().parent
+
+    final_dir = base_dir / "logs" / hostname
+    final_dir.mkdir(parents=True, exist_ok=True)
+    return final_dir
+
 
 class JVLoggerMeta(type):
     """
@@ -67,28 +175,20 @@ class JVLogger(metaclass=JVLoggerMeta):
             mutex_name: optional explicit name for the lock.
             signer: optional Signer instance to sign JSON logs.
             log_dir: optional directory path for logs; defaults to <script_dir>/logs
+
+        If the LOG_SERVER_ADDR environment variable is set (see start_log_server), file
+        output is forwarded to that server instead of being written by this process.
         """
-        base_name = name or (Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else "application")
+        base_name = name or default_app_name()
         self.name = base_name
         self.signer = signer
         self._lock = None
+        self._listener = None
+        self._pid = os.getpid()
+        self._log_dir_arg = log_dir
         self._lifecycle = lifecycle
-        self._process = psutil.Process()
-
-        self.log_dir = self._log_dir(log_dir)
         self._single_instance = single_instance
-
-        # Pre-calculate file paths
-        self._main_text_path = self.log_dir / f"{self.name}.log"
-        self._main_json_path = self.log_dir / f"{self.name}.json"
-
-        if not single_instance:
-            pid = self._process.pid
-            self._temp_text_path = self.log_dir / f"{self.name}_{pid}.log"
-            self._temp_json_path = self.log_dir / f"{self.name}_{pid}.json"
-        else:
-            self._temp_text_path = self._main_text_path
-            self._temp_json_path = self._main_json_path
+        self._server_address = os.environ.get(LOG_SERVER_ENV)
 
         # Optional single-instance lock (platform-aware)
         if single_instance:
@@ -104,13 +204,14 @@ class JVLogger(metaclass=JVLoggerMeta):
         self.logger.setLevel(level)
         self.logger.propagate = False
 
-        if not self.logger.handlers:
-            self._setup_handlers(level)
-
-        logging.captureWarnings(True)
+        # Fast path: the logger was already configured (e.g. by another JVLogger of the
+        # same name). Its handlers, files and merge belong to that instance.
+        self._owns_handlers = not self.logger.handlers
+        if self._owns_handlers:
+            self._configure(level)
 
-        if install_excepthooks:
-            install_global_exception_handlers()
+        # guarded internally, so cheap for every instance after the first
+        _one_time_global_init(install_excepthooks)
 
         if lifecycle:
             self._lifecycle = ApplicationLifecycleLogger(
@@ -122,6 +223,49 @@ class JVLogger(metaclass=JVLoggerMeta):
             self.logger.debug("Logger initialized")
 
 
+    # Paths are only resolved when first used, so an instance reusing a configured
+    # logger does no filesystem work (an explicit log_dir is created on resolution).
+    @functools.cached_property
+    def log_dir(self) -> Path:
+        return self._log_dir(self._log_dir_arg)
+
+    @functools.cached_property
+    def _main_text_path(self) -> Path:
+        return self.log_dir / f"{self.name}.log"
+
+    @functools.cached_property
+    def _main_json_path(self) -> Path:
+        return self.log_dir / f"{self.name}.json"
+
+    @functools.cached_property
+    def _temp_text_path(self) -> Path:
+        if self._single_instance:
+            return self._main_text_path
+        return self.log_dir / f"{self.name}_{self._pid}.log"
+
+    @functools.cached_property
+    def _temp_json_path(self) -> Path:
+        if self._single_instance:
+            return self._main_json_path
+        return self.log_dir / f"{self.name}_{self._pid}.json"
+
+    def _configure(self, level: int) -> None:
+        """First-time setup of the logger's handlers."""
+        if self._server_address:
+            try:
+                self._setup_remote_handlers(level)
+            except (OSError, EOFError, multiprocessing.AuthenticationError) as e:
+                # stale address or a process not started through multiprocessing
+                # (different authkey): log locally rather than fail the application
+                print(
+                    f"Cannot reach log server at {self._server_address} ({e!r}), writing local log files",
+                    file=sys.stderr,
+                )
+                self._server_address = None
+                self._setup_handlers(level)
+        else:
+            self._setup_handlers(level)
+
     def _log_dir(self, log_dir: Optional[Path]) -> Path:
         # Explicit directory provided → respect it
         if log_dir is not None:
@@ -129,50 +273,54 @@ class JVLogger(metaclass=JVLoggerMeta):
             final_dir.mkdir(parents=True, exist_ok=True)
             return final_dir
 
-        hostname = socket.gethostname()
+        return _default_log_dir()
 
-        # Frozen executable (PyInstaller)
-        if hasattr(sys, "_MEIPASS"):
-            base_dir = Path(sys.executable).resolve().parent
-        else:
-            base_dir = Path(sys.argv[0]).resolve().parent
-
-        base_dir = base_dir / "logs"
-
-        final_dir = base_dir / hostname
-        final_dir.mkdir(parents=True, exist_ok=True)
-        return final_dir
-
-    def _setup_handlers(self, level: int) -> None:
-        d = self.log_dir
-
-        # Console
+    def _setup_console_handler(self, level: int) -> None:
+        # Console stays attached directly so interactive output is immediate
         console = logging.StreamHandler(sys.stdout)
         console.setLevel(level)
-        console.setFormatter(ColoredFormatter("%(asctime)s - [%(name)s] - %(levelname)s - %(message)s"))
+        console.setFormatter(_CONSOLE_FORMATTER)
         self.logger.addHandler(console)
 
-        # Text file - daily rotation at midnight
-        text_handler = logging.handlers.TimedRotatingFileHandler(
-            filename=str(self._temp_text_path),
-            when="midnight",
-            backupCount=DEFAULT_BACKUP_COUNT,
-            encoding="utf-8",
-        )
-        text_handler.setLevel(logging.DEBUG)
-        text_handler.setFormatter(logging.Formatter("%(asctime)s - [%(name)s] - %(levelname)s - %(message)s"))
-        self.logger.addHandler(text_handler)
-
-        # JSON file - size rotation
-        json_handler = logging.handlers.TimedRotatingFileHandler(
-            filename=str(self._temp_json_path),
-            when="midnight",
-            backupCount=DEFAULT_BACKUP_COUNT,
-            encoding="utf-8",
+    def _setup_handlers(self, level: int) -> None:
+        self._setup_console_handler(level)
+
+        # Text file - daily rotation at midnight, JSON file - size rotation. Per-PID
+        # temp files are not size-rotated: the merge only picks up the live file, so
+        # the merged main file is rotated instead.
+        text_handler, json_handler = create_file_handlers(
+            self._temp_text_path,
+            self._temp_json_path,
+            signer=self.signer,
+            max_bytes=None if self._single_instance else 0,
         )
-        json_handler.setLevel(logging.DEBUG)
-        json_handler.setFormatter(JsonFormatter(signer=self.signer))
-        self.logger.addHandler(json_handler)
+
+        self._start_listener(text_handler, json_handler)
+
+    def _start_listener(self, *handlers: logging.Handler) -> None:
+        # Handlers run on the listener thread; callers only enqueue records
+        log_queue = queue.SimpleQueue()
+        queue_handler = LocalQueueHandler(log_queue)
+        self._listener = FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        _RUNNING_LISTENERS[self._listener] = (self.logger, queue_handler)
+        self.logger.addHandler(queue_handler)
+
+    def _setup_remote_handlers(self, level: int) -> None:
+        # The log server owns the files: nothing to write, rotate or merge here.
+        # Each put on the manager proxy is a blocking round trip, so it runs on the
+        # listener thread and callers still only pay for a local queue put.
+        remote_queue = connect_to_server(self._server_address)
+        self._setup_console_handler(level)
+        self._start_listener(RemoteQueueHandler(remote_queue))
+
+    def _stop_listener(self) -> None:
+        """Drain pending records and close the file handlers owned by the listener."""
+        listener, self._listener = self._listener, None
+        # absent once drained at exit
+        entry = _RUNNING_LISTENERS.pop(listener, None)
+        if entry is not None:
+            _drain_listener(listener, *entry)
 
     def get_logger(self) -> logging.Logger:
         return self.logger
@@ -206,6 +354,19 @@ class JVLogger(metaclass=JVLoggerMeta):
             self._lifecycle.stop()
             self._lifecycle = None
 
+        if self._owns_handlers:
+            self._close_handlers()
+
+        # release lock if any
+        if self._lock:
+            try:
+                self._lock.release()
+            finally:
+                self._lock = None
+
+    def _close_handlers(self) -> None:
+        self._stop_listener()
+
         # Close and remove handlers
         for handler in list(self.logger.handlers):
             try:
@@ -217,17 +378,11 @@ class JVLogger(metaclass=JVLoggerMeta):
             except Exception:
                 pass
 
-        # Merge logs if they were temporary
-        if not self._single_instance:
+        # Merge logs if they were temporary. A forked child closing an inherited
+        # instance leaves the parent's files alone.
+        if not self._single_instance and not self._server_address and self._pid == os.getpid():
             self._merge_logs()
 
-        # release lock if any
-        if self._lock:
-            try:
-                self._lock.release()
-            finally:
-                self._lock = None
-
     def __enter__(self) -> "JVLogger":
         return self
 
@@ -250,6 +405,10 @@ class JVLogger(metaclass=JVLoggerMeta):
                 try:
                     self._append_file(self._temp_text_path, self._main_text_path)
                     self._append_file(self._temp_json_path, self._main_json_path)
+                    try:
+                        rollover_if_oversized(self._main_json_path)
+                    except OSError as e:
+                        print(f"Error rotating log file {self._main_json_path}: {e}", file=sys.stderr)
                 finally:
                     merge_lock.release()
 
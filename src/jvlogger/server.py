@@ -0,0 +1,194 @@
+"""
+Central log server for multi-process applications.
+
+One server process owns the rotating text/JSON files. Workers only attach a
+RemoteQueueHandler forwarding records to it, so there is no per-process file
+locking, temp files or merging on close.
+
+Server side (parent / supervisor):
+    server = start_log_server("logs", name="my_app")
+    ... start worker processes; they inherit LOG_SERVER_ADDR ...
+    server.stop()
+
+Worker side:
+    with JVLogger(name="worker") as logger:   # LOG_SERVER_ADDR set -> forwards
+        logger.info("hello")
+
+A worker's logging call only does a local queue put. A background thread in the
+worker forwards records to the server, one blocking round trip per record
+(roughly 50-100 us), so sustained throughput per worker is bounded by that.
+
+Workers authenticate with the multiprocessing authkey, which processes started
+through multiprocessing inherit. Records are pickled, so `extra` values and the
+signer passed to the server must be picklable. Stop the server after the workers;
+one still running at exit is stopped (and drained) by an atexit hook.
+"""
+
+import atexit
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import uuid
+import multiprocessing
+from multiprocessing.managers import BaseManager
+from pathlib import Path
+from typing import Optional, Tuple
+from .handlers import FlushingQueueListener, create_file_handlers
+from .signing import Signer
+from .utils import default_app_name
+
+LOG_SERVER_ENV = "LOG_SERVER_ADDR"
+SERVER_START_TIMEOUT = 10.0  # seconds
+
+
+# Servers started here and not stopped yet. The atexit hook is registered when this
+# module is imported, before jvlogger.py registers its listener drain; atexit runs
+# in reverse order, so workers in this process forward their last records first.
+_RUNNING_SERVERS = set()
+
+
+@atexit.register
+def _stop_running_servers() -> None:
+    for server in list(_RUNNING_SERVERS):
+        server.stop()
+
+
+class _ServerManager(BaseManager):
+    pass
+
+
+class _ClientManager(BaseManager):
+    pass
+
+
+_ClientManager.register("get_queue")
+_ClientManager.register("stop")
+
+
+def _fresh_address() -> Tuple[str, Optional[str]]:
+    """Return a new server address and the temporary directory holding it, if any."""
+    if os.name == "nt":
+        return rf"\\.\pipe\jvlogger-{os.getpid()}-{uuid.uuid4().hex}", None
+    socket_dir = tempfile.mkdtemp(prefix="jvlogger-")
+    return os.path.join(socket_dir, "server.sock"), socket_dir
+
+
+def _serve(address: str, authkey: bytes, name: str, log_dir: Path, signer: Optional[Signer], ready) -> None:
+    log_queue = queue.Queue()
+    stop_requested = threading.Event()
+    _ServerManager.register("get_queue", callable=lambda: log_queue)
+    _ServerManager.register("stop", callable=stop_requested.set)
+    server = _ServerManager(address=address, authkey=authkey).get_server()
+
+    text_handler, json_handler = create_file_handlers(
+        log_dir / f"{name}.log", log_dir / f"{name}.json", signer=signer
+    )
+    listener = FlushingQueueListener(log_queue, text_handler, json_handler, respect_handler_level=True)
+    listener.start()
+    # never returns; the thread dies with the process once the files are closed
+    threading.Thread(target=server.serve_forever, name="jvlogger-server", daemon=True).start()
+    ready.set()
+    try:
+        stop_requested.wait()
+    finally:
+        listener.stop()
+        text_handler.close()
+        json_handler.close()
+
+
+class LogServer:
+    """Handle on a running log server process."""
+
+    def __init__(
+        self,
+        process: multiprocessing.Process,
+        address: str,
+        authkey: bytes,
+        socket_dir: Optional[str] = None,
+    ):
+        self.process = process
+        self.address = address
+        self._authkey = authkey
+        self._socket_dir = socket_dir
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Drain pending records, close the log files and wait for the server to exit."""
+        _RUNNING_SERVERS.discard(self)
+        if os.environ.get(LOG_SERVER_ENV) == self.address:
+            del os.environ[LOG_SERVER_ENV]
+
+        if self.process.is_alive():
+            try:
+                manager = _ClientManager(address=self.address, authkey=self._authkey)
+                manager.connect()
+                manager.stop()
+            except (OSError, EOFError):
+                # the server may exit before its reply goes out
+                pass
+        self.process.join(timeout)
+        if self._socket_dir and not self.process.is_alive():
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+
+    def __enter__(self) -> "LogServer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def start_log_server(
+    log_dir: str,
+    name: Optional[str] = None,
+    signer: Optional[Signer] = None,
+    address: Optional[str] = None,
+) -> LogServer:
+    """
+    Spawn the log server process and export its address in LOG_SERVER_ADDR so that
+    JVLogger instances created afterwards (here or in child processes) forward to it.
+
+    Parameters:
+        log_dir: directory for <name>.log / <name>.json.
+        name: base name of the log files. Defaults to script stem.
+        signer: optional Signer for the JSON log (must be picklable).
+        address: Unix socket path / Windows pipe name. Defaults to a fresh one.
+    """
+    name = name or default_app_name()
+    log_dir = Path(log_dir).resolve()
+    log_dir.mkdir(parents=True, exist_ok=True)
+    socket_dir = None
+    if not address:
+        address, socket_dir = _fresh_address()
+    authkey = bytes(multiprocessing.current_process().authkey)
+
+    ready = multiprocessing.Event()
+    process = multiprocessing.Process(
+        target=_serve,
+        args=(address, authkey, name, log_dir, signer, ready),
+        name=f"jvlogger-server-{name}",
+        daemon=True,
+    )
+    process.start()
+    if not ready.wait(SERVER_START_TIMEOUT):
+        process.terminate()
+        if socket_dir:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+        raise RuntimeError(f"log server for {name!r} failed to start")
+
+    os.environ[LOG_SERVER_ENV] = address
+    server = LogServer(process, address, authkey, socket_dir)
+    # the process is a daemon: without this, exiting without stop() would kill it
+    # with records still queued or buffered
+    _RUNNING_SERVERS.add(server)
+    return server
+
+
+def connect_to_server(address: Optional[str] = None, authkey: Optional[bytes] = None):
+    """Return a proxy to the server's record queue, suitable for a QueueHandler."""
+    manager = _ClientManager(
+        address=address or os.environ[LOG_SERVER_ENV],
+        authkey=authkey or bytes(multiprocessing.current_process().authkey),
+    )
+    manager.connect()
+    return manager.get_queue()
@@ -3,10 +3,16 @@ Utility functions for human-readable formatting.
 
 - duration formatting (wall / CPU time)
 - byte size formatting (RAM, files, buffers)
+
+plus the default application name shared by JVLogger and the log server.
 """
 
 from __future__ import annotations
 
+import functools
+import sys
+from pathlib import Path
+
 
 SECONDS_PER_MINUTE = 60
 SECONDS_PER_HOUR = 60 * SECONDS_PER_MINUTE
@@ -91,3 +97,9 @@ def format_bytes(num_bytes: int) -> str:
         num_bytes /= step
 
     return f"{num_bytes:.2f} EB"
+
+
+@functools.lru_cache(maxsize=1)
+def default_app_name() -> str:
+    """Stem of the running script, or "application" when there is none."""
+    return Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else "application"
@@ -1,6 +1,16 @@
 import pytest
 import tempfile
 from pathlib import Path
+from jvlogger import hooks
+
+@pytest.fixture(autouse=True, scope="session")
+def crash_file_outside_source_tree(tmp_path_factory):
+    # JVLogger installs the exception hooks by default, which opens last_crash.log
+    original = hooks.LAST_CRASH_FILE
+    hooks.LAST_CRASH_FILE = tmp_path_factory.mktemp("crash") / "last_crash.log"
+    yield
+    hooks._close_crash_file()
+    hooks.LAST_CRASH_FILE = original
 
 @pytest.fixture()
 def temp_log_dir():
@@ -0,0 +1,42 @@
+import os
+import sys
+import multiprocessing
+import pytest
+from jvlogger import JVLogger
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="fork() not available")
+
+
+def run_child(name, log_dir, message):
+    with JVLogger(name=name, log_dir=log_dir, install_excepthooks=False) as logger:
+        logger.info(message)
+
+
+def test_forked_children_reach_parent_files(temp_log_dir):
+    app_name = "fork_test"
+    logger = JVLogger(name=app_name, log_dir=temp_log_dir, install_excepthooks=False)
+    logger.info("from parent")
+
+    p = multiprocessing.get_context("fork").Process(
+        target=run_child, args=(app_name, temp_log_dir, "from multiprocessing child")
+    )
+    p.start()
+    p.join()
+    assert p.exitcode == 0
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            run_child(app_name, temp_log_dir, "from os.fork child")
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+    logger.info("parent after fork")
+    logger.close()
+
+    for suffix in (".log", ".json"):
+        content = (temp_log_dir / f"{app_name}{suffix}").read_text(encoding="utf-8")
+        for message in ("from parent", "from multiprocessing child", "from os.fork child", "parent after fork"):
+            assert content.count(message) == 1, (suffix, message)
+    assert not list(temp_log_dir.glob(f"{app_name}_*"))
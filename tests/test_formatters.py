@@ -0,0 +1,112 @@
+import json
+import sys
+import logging
+from datetime import datetime
+import pytest
+from colorama import Fore, Style
+from jvlogger.formatters import ColoredFormatter, JsonFormatter
+
+
+def _record(msg, *args, level=logging.INFO):
+    return logging.LogRecord("fmt_test", level, "/tmp/module.py", 42, msg, args, None, func="handler")
+
+
+def test_json_formatter_fields():
+    entry = json.loads(JsonFormatter().format(_record("hello %s", "wörld")))
+
+    assert entry["name"] == "fmt_test"
+    assert entry["level"] == "INFO"
+    assert entry["message"] == "hello wörld"
+    assert entry["file"] == "module.py"
+    assert entry["line"] == 42
+    assert entry["function"] == "handler"
+    assert "traceback" not in entry
+
+
+def test_json_formatter_stdlib_fallback(monkeypatch):
+    record = _record('quote " and \\ backslash')
+    fast = JsonFormatter()
+    monkeypatch.setattr("jvlogger.formatters.ORJSON_AVAILABLE", False)
+    slow = JsonFormatter()
+
+    assert json.loads(fast.format(record)) == json.loads(slow.format(record))
+
+
+def test_json_formatter_fast_path_matches_dict_path():
+    formatter = JsonFormatter()
+    record = _record('tab\there "quoted" ☃ %d', 7)
+
+    fast = json.loads(formatter.format(record))
+    full = json.loads(formatter._encode(formatter._build(record)))
+
+    assert fast == full
+    assert list(fast) == list(full)
+
+
+def test_json_formatter_keeps_traceback():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("fmt_test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info())
+
+    entry = json.loads(JsonFormatter().format(record))
+    assert "ValueError: boom" in entry["traceback"]
+
+
+def test_json_formatter_timestamp_milliseconds():
+    formatter = JsonFormatter()
+    first = _record("first")
+    first.created = 1_700_000_000.1234
+    second = _record("second")
+    second.created = 1_700_000_000.1239
+    third = _record("third")
+    third.created = 1_700_000_000.1241
+
+    ts = [json.loads(formatter.format(r))["timestamp"] for r in (first, second, third)]
+
+    assert ts[0] == datetime.fromtimestamp(1_700_000_000.123).isoformat(timespec="milliseconds")
+    assert ts[0] == ts[1]
+    assert ts[2].endswith(".124")
+
+
+def test_colored_formatter_restores_record():
+    record = _record("console %s", "line", level=logging.WARNING)
+    output = ColoredFormatter("%(levelname)s %(message)s").format(record)
+
+    assert output.startswith(Fore.YELLOW + "WARNING" + Style.RESET_ALL)
+    assert output.endswith("console line")
+    assert record.levelname == "WARNING"
+
+
+def test_colored_formatter_restores_levelname_on_error():
+    record = _record("%d", "not a number", level=logging.ERROR)
+
+    with pytest.raises(TypeError):
+        ColoredFormatter("%(levelname)s %(message)s").format(record)
+    assert record.levelname == "ERROR"
+
+
+def test_json_formatter_format_bytes_matches_format():
+    formatter = JsonFormatter()
+    record = _record('bytes "line" ☃ %s', "ok")
+
+    assert json.loads(formatter.format_bytes(record)) == json.loads(formatter.format(record))
+
+
+def test_json_formatter_format_bytes_with_surrogates(monkeypatch):
+    monkeypatch.setattr("jvlogger.formatters.ORJSON_AVAILABLE", False)
+    entry = json.loads(JsonFormatter().format_bytes(_record("bad \udcff byte")))
+
+    assert entry["message"] == "bad \udcff byte"
+
+
+def test_colored_formatter_uses_renamed_levelname():
+    logging.addLevelName(logging.WARNING, "WARN")
+    try:
+        record = _record("renamed", level=logging.WARNING)
+        output = ColoredFormatter("%(levelname)s %(message)s").format(record)
+    finally:
+        logging.addLevelName(logging.WARNING, "WARNING")
+
+    assert output == Fore.YELLOW + "WARN" + Style.RESET_ALL + " renamed"
+    assert record.levelname == "WARN"
@@ -0,0 +1,155 @@
+import gzip
+import json
+import logging
+from jvlogger import JVLogger, handlers
+from jvlogger.formatters import JsonFormatter
+from jvlogger.handlers import (
+    BinaryRotatingFileHandler,
+    BufferedRotatingFileHandler,
+    BufferedTimedRotatingFileHandler,
+    create_file_handlers,
+    rollover_if_oversized,
+)
+from jvlogger.signing import HMACSigner
+
+
+def _record(level, msg):
+    return logging.LogRecord("buffered", level, __file__, 1, msg, None, None)
+
+
+def test_buffered_handler_flushes_on_warning(temp_log_dir):
+    path = temp_log_dir / "buffered.log"
+    handler = BufferedTimedRotatingFileHandler(str(path), when="midnight", encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        handler._last_flush = float("inf")  # pretend we just flushed
+        handler.emit(_record(logging.INFO, "buffered info"))
+        assert path.read_text(encoding="utf-8") == ""
+
+        handler.emit(_record(logging.WARNING, "flushed warning"))
+        assert path.read_text(encoding="utf-8") == "buffered info\nflushed warning\n"
+    finally:
+        handler.close()
+
+
+def test_buffered_handler_close_writes_pending(temp_log_dir):
+    path = temp_log_dir / "pending.log"
+    handler = BufferedTimedRotatingFileHandler(str(path), when="midnight", encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler._last_flush = float("inf")
+    handler.emit(_record(logging.DEBUG, "pending"))
+    handler.close()
+
+    assert path.read_text(encoding="utf-8") == "pending\n"
+
+
+def test_rotating_handler_tracks_size(temp_log_dir):
+    path = temp_log_dir / "sized.json"
+    path.write_text("x" * 10, encoding="utf-8")
+    handler = BufferedRotatingFileHandler(str(path), maxBytes=32, backupCount=2, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        assert handler._bytes_written == 10
+        handler.emit(_record(logging.INFO, "a" * 9))
+        assert handler._bytes_written == 20
+        handler.emit(_record(logging.INFO, "b" * 15))
+    finally:
+        handler.close()
+
+    assert (temp_log_dir / "sized.json.1").read_text(encoding="utf-8") == "x" * 10 + "a" * 9 + "\n"
+    assert path.read_text(encoding="utf-8") == "b" * 15 + "\n"
+    assert handler._bytes_written == 16
+
+
+def test_json_backups_are_gzipped(temp_log_dir):
+    text_handler, json_handler = create_file_handlers(temp_log_dir / "app.log", temp_log_dir / "app.json")
+    text_handler.close()
+    json_handler.maxBytes = 64
+    try:
+        for i in range(6):
+            json_handler.emit(_record(logging.INFO, f"message {i}"))
+    finally:
+        json_handler.close()
+
+    backups = sorted(temp_log_dir.glob("app.json.*"))
+    assert backups and all(p.suffix == ".gz" for p in backups)
+
+    lines = []
+    for backup in reversed(backups):
+        with gzip.open(backup, "rt", encoding="utf-8") as f:
+            lines += f.read().splitlines()
+    lines += (temp_log_dir / "app.json").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["message"] for line in lines] == [f"message {i}" for i in range(6)]
+
+
+def test_merged_json_keeps_every_record(temp_log_dir, monkeypatch):
+    # enough records for several rotations of a per-PID temp file
+    monkeypatch.setattr(handlers, "DEFAULT_MAX_BYTES", 2000)
+    for run in range(2):
+        logger = JVLogger(name="merged", log_dir=temp_log_dir, install_excepthooks=False)
+        for i in range(50):
+            logger.info(f"run {run} message {i}")
+        logger.close()
+
+    assert not list(temp_log_dir.glob("merged_*"))
+    lines = []
+    for backup in sorted(temp_log_dir.glob("merged.json.*.gz"), reverse=True):
+        with gzip.open(backup, "rt", encoding="utf-8") as f:
+            lines += f.read().splitlines()
+    main = temp_log_dir / "merged.json"
+    if main.exists():
+        lines += main.read_text(encoding="utf-8").splitlines()
+    messages = [json.loads(line)["message"] for line in lines]
+    assert messages == [f"run {run} message {i}" for run in range(2) for i in range(50)]
+
+
+def test_rollover_if_oversized(temp_log_dir):
+    path = temp_log_dir / "merged.json"
+    path.write_bytes(b"x" * 100)
+
+    rollover_if_oversized(path, max_bytes=200)
+    assert [p.name for p in temp_log_dir.iterdir()] == ["merged.json"]
+
+    rollover_if_oversized(path, max_bytes=100)
+    assert not path.exists()
+    with gzip.open(temp_log_dir / "merged.json.1.gz", "rb") as f:
+        assert f.read() == b"x" * 100
+
+
+def test_file_handlers_open_lazily(temp_log_dir):
+    text_handler, json_handler = create_file_handlers(temp_log_dir / "lazy.log", temp_log_dir / "lazy.json")
+    try:
+        assert list(temp_log_dir.iterdir()) == []
+        json_handler.emit(_record(logging.INFO, "first"))
+        assert [p.name for p in temp_log_dir.iterdir()] == ["lazy.json"]
+    finally:
+        text_handler.close()
+        json_handler.close()
+
+
+def test_file_handlers_share_formatters(temp_log_dir):
+    first = create_file_handlers(temp_log_dir / "a.log", temp_log_dir / "a.json")
+    second = create_file_handlers(temp_log_dir / "b.log", temp_log_dir / "b.json")
+    signed = create_file_handlers(temp_log_dir / "c.log", temp_log_dir / "c.json", signer=HMACSigner(b"k" * 32))
+    try:
+        assert first[0].formatter is second[0].formatter is signed[0].formatter
+        assert first[1].formatter is second[1].formatter
+        assert signed[1].formatter is not first[1].formatter
+    finally:
+        for handler in first + second + signed:
+            handler.close()
+
+
+def test_binary_handler_writes_json_bytes(temp_log_dir):
+    path = temp_log_dir / "binary.json"
+    handler = BinaryRotatingFileHandler(str(path), maxBytes=1 << 20, encoding="utf-8", delay=True)
+    handler.setFormatter(JsonFormatter())
+    try:
+        handler.emit(_record(logging.INFO, "héllo ☃"))
+        handler.emit(_record(logging.INFO, "second"))
+    finally:
+        handler.close()
+
+    data = path.read_bytes()
+    assert handler._bytes_written == len(data)
+    assert [json.loads(line)["message"] for line in data.decode("utf-8").splitlines()] == ["héllo ☃", "second"]
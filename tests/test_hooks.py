@@ -1,6 +1,81 @@
-from jvlogger.hooks import install_global_exception_handlers
+import asyncio
+import sys
+import threading
+import pytest
+from jvlogger import hooks
+from jvlogger.hooks import asyncio_exception_handler, install_global_exception_handlers
 
-def test_hooks_installable_twice():
+
+@pytest.fixture()
+def fresh_hooks(monkeypatch, temp_log_dir):
+    """Let install_global_exception_handlers() run for real, outside the source tree."""
+    monkeypatch.setattr(hooks, "LAST_CRASH_FILE", temp_log_dir / "last_crash.log")
+    monkeypatch.setattr(hooks, "_crash_fd", None)
+    monkeypatch.setattr(hooks, "_GLOBAL_HOOKS_INSTALLED", False)
+    monkeypatch.setattr(sys, "excepthook", sys.excepthook)
+    monkeypatch.setattr(threading, "excepthook", threading.excepthook)
+    yield temp_log_dir / "last_crash.log"
+    hooks._close_crash_file()
+
+
+def test_hooks_installable_twice(fresh_hooks):
     # should not crash or reinstall twice
     install_global_exception_handlers()
     install_global_exception_handlers()
+    assert fresh_hooks.exists()
+
+
+def test_hooks_not_reinstalled(monkeypatch, fresh_hooks):
+    install_global_exception_handlers()
+
+    def custom_hook(*args):
+        pass
+
+    monkeypatch.setattr(sys, "excepthook", custom_hook)
+    install_global_exception_handlers()
+
+    assert sys.excepthook is custom_hook
+
+
+def test_asyncio_handler_dumps_off_the_loop(monkeypatch):
+    dumped = []
+    monkeypatch.setattr(
+        "jvlogger.hooks.dump_last_crash",
+        lambda exc_type, exc_value, exc_tb: dumped.append((exc_type, threading.current_thread())),
+    )
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        asyncio_exception_handler(loop, {"message": "task failed", "exception": ValueError("boom")})
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(main())
+
+    assert len(dumped) == 1
+    assert dumped[0][0] is ValueError
+    assert dumped[0][1] is not loop_thread
+
+
+def _exc_info(exc):
+    try:
+        raise exc
+    except Exception as e:
+        return type(e), e, e.__traceback__
+
+
+def test_dump_last_crash_rewrites_open_file(monkeypatch, temp_log_dir):
+    crash_file = temp_log_dir / "last_crash.log"
+    monkeypatch.setattr(hooks, "LAST_CRASH_FILE", crash_file)
+    monkeypatch.setattr(hooks, "_crash_fd", None)
+
+    hooks._open_crash_file()
+    try:
+        assert hooks._crash_fd is not None
+        hooks.dump_last_crash(*_exc_info(RuntimeError("a much longer first failure message")))
+        hooks.dump_last_crash(*_exc_info(ValueError("second")))
+    finally:
+        hooks._close_crash_file()
+
+    content = crash_file.read_text(encoding="utf-8")
+    assert content.rstrip().endswith("ValueError: second")
+    assert "RuntimeError" not in content
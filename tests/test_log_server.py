@@ -0,0 +1,84 @@
+import json
+import os
+import multiprocessing
+from pathlib import Path
+from jvlogger import JVLogger, start_log_server
+from jvlogger import server as server_module
+from jvlogger.server import LOG_SERVER_ENV
+
+
+def run_worker(name, log_dir, message):
+    with JVLogger(name=name, log_dir=log_dir, install_excepthooks=False) as logger:
+        logger.info(message)
+        try:
+            raise ValueError("worker failure")
+        except ValueError:
+            logger.exception("worker %s failed", name)
+
+
+def test_workers_forward_to_log_server(temp_log_dir):
+    server = start_log_server(temp_log_dir, name="central")
+    try:
+        workers = [
+            multiprocessing.Process(target=run_worker, args=(f"worker{i}", temp_log_dir, f"Message from worker {i}"))
+            for i in (1, 2)
+        ]
+        for p in workers:
+            p.start()
+        for p in workers:
+            p.join()
+    finally:
+        server.stop()
+
+    assert all(p.exitcode == 0 for p in workers)
+    assert not server.process.is_alive()
+    if os.name != "nt":
+        # the socket lives in a temporary directory removed on stop
+        assert not Path(server.address).parent.exists()
+
+    content = (Path(temp_log_dir) / "central.log").read_text(encoding="utf-8")
+    assert "Message from worker 1" in content
+    assert "Message from worker 2" in content
+
+    entries = [json.loads(line) for line in (Path(temp_log_dir) / "central.json").read_text(encoding="utf-8").splitlines()]
+    failures = [e for e in entries if e["level"] == "ERROR"]
+    assert len(failures) == 2
+    assert all("ValueError: worker failure" in e["traceback"] for e in failures)
+
+    # workers wrote nothing themselves
+    assert list(Path(temp_log_dir).glob("worker*")) == []
+
+
+def _assert_local_fallback(temp_log_dir, name, capsys):
+    with JVLogger(name=name, log_dir=temp_log_dir, install_excepthooks=False) as logger:
+        logger.info("logged locally")
+    assert "Cannot reach log server" in capsys.readouterr().err
+    assert "logged locally" in (Path(temp_log_dir) / f"{name}.log").read_text(encoding="utf-8")
+
+
+def test_stale_server_address_falls_back_to_local_files(monkeypatch, temp_log_dir, capsys):
+    monkeypatch.setenv(LOG_SERVER_ENV, str(Path(temp_log_dir) / "gone.sock"))
+    _assert_local_fallback(temp_log_dir, "stale_addr", capsys)
+
+
+def test_foreign_authkey_falls_back_to_local_files(monkeypatch, temp_log_dir, capsys):
+    server = start_log_server(temp_log_dir, name="central")
+    try:
+        # what a child started with plain subprocess would present
+        monkeypatch.setattr(multiprocessing.current_process(), "authkey", b"not-the-server-key")
+        _assert_local_fallback(temp_log_dir, "foreign_key", capsys)
+    finally:
+        monkeypatch.undo()
+        server.stop()
+
+
+def test_unstopped_server_is_drained_at_exit(temp_log_dir):
+    server = start_log_server(temp_log_dir, name="at_exit")
+    with JVLogger(name="exit_worker", log_dir=temp_log_dir, install_excepthooks=False) as logger:
+        logger.info("flushed by the exit hook")
+
+    # what atexit runs when the application never calls server.stop()
+    server_module._stop_running_servers()
+
+    assert not server.process.is_alive()
+    assert "flushed by the exit hook" in (Path(temp_log_dir) / "at_exit.log").read_text(encoding="utf-8")
@@ -1,5 +1,10 @@
+import gc
 import logging
+import os
+import weakref
 from jvlogger import JVLogger
+from jvlogger import jvlogger as jvlogger_module
+from jvlogger.handlers import LocalQueueHandler
 
 def test_logger_creation(temp_log_dir):
     wrapper = JVLogger(
@@ -12,6 +17,78 @@ def test_logger_creation(temp_log_dir):
 
     assert logger.name == "test_app"
     assert logger.level == logging.DEBUG
-    assert len(logger.handlers) == 3  # console + text + json
+    assert len(logger.handlers) == 2  # console + queue (text + json run on the listener)
 
     wrapper.close()
+
+
+def test_second_instance_reuses_configured_logger(temp_log_dir):
+    owner = JVLogger(name="shared_app", install_excepthooks=False, log_dir=temp_log_dir)
+    handlers = list(owner.get_logger().handlers)
+
+    second = JVLogger(name="shared_app", install_excepthooks=False, log_dir=temp_log_dir)
+    assert second.get_logger() is owner.get_logger()
+    assert second.get_logger().handlers == handlers
+    assert second.log_dir == owner.log_dir == temp_log_dir.resolve()
+    assert second._main_json_path == owner._main_json_path
+    assert second._temp_text_path == owner._temp_text_path
+
+    # closing the second instance leaves the owner's handlers in place
+    second.close()
+    assert owner.get_logger().handlers == handlers
+
+    owner.close()
+    assert owner.get_logger().handlers == []
+
+
+def test_second_instance_resolves_paths_lazily(temp_log_dir):
+    owner = JVLogger(name="lazy_paths", install_excepthooks=False, log_dir=temp_log_dir)
+    other_dir = temp_log_dir / "unused"
+
+    second = JVLogger(name="lazy_paths", install_excepthooks=False, log_dir=other_dir)
+    assert not other_dir.exists()
+    assert second._temp_json_path == other_dir.resolve() / f"lazy_paths_{os.getpid()}.json"
+
+    second.close()
+    owner.close()
+
+
+def test_exit_drain_detaches_queue_handler(temp_log_dir):
+    wrapper = JVLogger(name="drained_app", install_excepthooks=False, log_dir=temp_log_dir)
+    logger = wrapper.get_logger()
+    logger.info("before exit")
+
+    jvlogger_module._drain_running_listeners()
+
+    # only the console handler is left: later records are not queued for nobody
+    assert not any(isinstance(h, LocalQueueHandler) for h in logger.handlers)
+    assert "before exit" in (temp_log_dir / f"drained_app_{os.getpid()}.log").read_text(encoding="utf-8")
+    wrapper.close()
+
+
+def test_running_listener_does_not_keep_instance_alive(temp_log_dir):
+    wrapper = JVLogger(name="collected_app", install_excepthooks=False, log_dir=temp_log_dir)
+    ref = weakref.ref(wrapper)
+    logger = wrapper.get_logger()
+    del wrapper
+    gc.collect()
+
+    assert ref() is None
+    jvlogger_module._drain_running_listeners()
+    assert not any(isinstance(h, LocalQueueHandler) for h in logger.handlers)
+    for handler in list(logger.handlers):
+        handler.close()
+        logger.removeHandler(handler)
+
+
+def test_second_instance_can_install_hooks(monkeypatch, temp_log_dir):
+    installed = []
+    monkeypatch.setattr(jvlogger_module, "install_global_exception_handlers", lambda: installed.append(True))
+
+    owner = JVLogger(name="hooks_app", install_excepthooks=False, log_dir=temp_log_dir)
+    assert installed == []
+    second = JVLogger(name="hooks_app", install_excepthooks=True, log_dir=temp_log_dir)
+    assert installed == [True]
+
+    second.close()
+    owner.close()